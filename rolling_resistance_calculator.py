@@ -2,11 +2,14 @@ import math
 import csv
 import os
 import sys
+from functools import lru_cache
 import tkinter as tk
 from tkinter import messagebox
+import numpy as np
 import xlsxwriter
-import matplotlib.pyplot as plt
-from openpyxl import load_workbook
+
+# matplotlib and openpyxl are imported lazily inside the callbacks that
+# need them so the Tk window appears without paying their import cost
 
 # Basic constants for wheel size, motor speed and gravity
 d = 0.645           # wheel diameter in m
@@ -18,6 +21,11 @@ g = 9.81            # acceleration due to gravity in m/s^2
 l_hang = 0.875      # length hanging mass in m
 l_reifen = 0.358    # length tire in m
 
+# Derived constants folded once at import time
+_V_SPEED = math.pi * d * (rpm / 60.0)   # wheel surface speed in m/s
+_LEVER_RATIO = l_hang / l_reifen        # hanging mass to effective tire load
+_CRR_DENOM_SCALE = g * _V_SPEED         # per-kg denominator of C_rr
+
 # Column order used everywhere
 FIELDNAMES = [
     "Tire name / type",
@@ -35,74 +43,91 @@ FIELDNAMES = [
     "C_rr",
 ]
 
+# Decimal places per column for CSV and Excel export
+_DECIMAL_PLACES = {
+    "Mean idle current [A]": 3,
+    "Mean load current [A]": 3,
+    "Speed [m/s]": 3,
+    "P_0 [W]": 2,
+    "P_load [W]": 2,
+    "P_rr [W]": 2,
+    "C_rr": 6,
+    "Effective weight on tire [kg]": 3,
+    "Weight on lever [kg]": 3,
+    "Tire pressure [bar]": 2,
+}
+
+# Bound str.format methods so the format spec is parsed only once
+_FMT = {key: f"{{:.{dp}f}}".format for key, dp in _DECIMAL_PLACES.items()}
+_DEFAULT_FMT = "{:.3f}".format
+
+# Translation table for converting decimal commas to dots
+_COMMA_TO_DOT = str.maketrans({",": "."})
+
 
 def get_unique_filename(base_path):
     """Return unique filename: base, base (2), base (3), ..."""
     if not os.path.exists(base_path):
         return base_path
     name, ext = os.path.splitext(base_path)
-    counter = 2
-    while True:
-        candidate = f"{name} ({counter}){ext}"
-        if not os.path.exists(candidate):
-            return candidate
-        counter += 1
+
+    # Double the counter until a free one is found, then binary search for
+    # the smallest free counter so only O(log N) files are stat'ed
+    lo, hi = 2, 2
+    while os.path.exists(f"{name} ({hi}){ext}"):
+        lo, hi = hi, hi * 2
+    while lo + 1 < hi:
+        mid = (lo + hi) // 2
+        if os.path.exists(f"{name} ({mid}){ext}"):
+            lo = mid
+        else:
+            hi = mid
+    return f"{name} ({hi}){ext}"
 
 
 def parse_float_list(text):
-    """Parse a space separated string of numbers into a list of floats."""
-    parts = text.strip().split()
+    """Parse a space separated string of numbers into a float array."""
+    parts = text.translate(_COMMA_TO_DOT).split()
     if not parts:
         raise ValueError("No values entered")
-    values = []
-    for p in parts:
-        p_clean = p.replace(",", ".")
-        values.append(float(p_clean))
-    return values
-
-
-def format_value(key, value):
-    """Format numeric and string values for CSV and Excel export."""
-    if value is None or value == "":
-        return ""
-
-    if isinstance(value, (float, int)):
-        decimal_places = {
-            "Mean idle current [A]": 3,
-            "Mean load current [A]": 3,
-            "Speed [m/s]": 3,
-            "P_0 [W]": 2,
-            "P_load [W]": 2,
-            "P_rr [W]": 2,
-            "C_rr": 6,
-            "Effective weight on tire [kg]": 3,
-            "Weight on lever [kg]": 3,
-            "Tire pressure [bar]": 2,
-        }
-        dp = decimal_places.get(key, 3)
-        s = f"{float(value):.{dp}f}"
-        return s.replace(",", ".")
-
-    if isinstance(value, str):
-        return value.replace(",", ".")
-
-    return value
+    return np.array(parts, dtype=np.float64)
 
 
-def compute_result(idle_values, load_values, m_hang):
-    """Compute speed, currents, powers, effective weight and rolling resistance."""
-    U = math.pi * d
-    v = U * (rpm / 60.0)
+def _make_formatter(key):
+    """Build a per-column formatter with the format method bound up front."""
+    fmt = _FMT.get(key, _DEFAULT_FMT)
+
+    def formatter(value):
+        if value is None or value == "":
+            return ""
+        if isinstance(value, (float, int)):
+            s = fmt(float(value))
+            return s if "," not in s else s.translate(_COMMA_TO_DOT)
+        if isinstance(value, str):
+            return value if "," not in value else value.translate(_COMMA_TO_DOT)
+        return value
+
+    return formatter
 
-    I_idle = sum(idle_values) / len(idle_values)
-    I_load = sum(load_values) / len(load_values)
 
-    m_eff = (m_hang * l_hang) / l_reifen
+# One formatter per column, indexed like FIELDNAMES, for the export loops
+_COL_FORMATTERS = [_make_formatter(key) for key in FIELDNAMES]
+
+
+@lru_cache(maxsize=64)
+def _compute_cached(idle_values, load_values, m_hang):
+    """Cached core of compute_result, keyed on hashable input tuples."""
+    v = _V_SPEED
+
+    I_idle = np.mean(idle_values)
+    I_load = np.mean(load_values)
+
+    m_eff = m_hang * _LEVER_RATIO
 
     P0 = V_supply * I_idle
     P_weighted = V_supply * I_load
     P_rr = P_weighted - P0
-    C_rr = P_rr / (m_eff * g * v)
+    C_rr = P_rr / (m_eff * _CRR_DENOM_SCALE)
 
     return {
         "Speed [m/s]": v,
@@ -117,6 +142,13 @@ def compute_result(idle_values, load_values, m_hang):
     }
 
 
+def compute_result(idle_values, load_values, m_hang):
+    """Compute speed, currents, powers, effective weight and rolling resistance."""
+    result = _compute_cached(tuple(idle_values), tuple(load_values), m_hang)
+    # Copy so callers cannot mutate the cached entry
+    return dict(result)
+
+
 class RollingResistanceApp:
     def __init__(self, root):
         self.root = root
@@ -126,6 +158,15 @@ class RollingResistanceApp:
         self.saved_rows = []
         # Last calculated result, used by Save to List
         self.last_result = None
+        # Modification time of the Excel file after our last write, used to
+        # detect edits made by the user in Excel
+        self._last_write_mtime = 0.0
+        # Whether we have written the Excel file yet, so callbacks do not
+        # have to stat() it on every click
+        self._xlsx_exists = False
+        # How many leading entries of saved_rows were in the last export,
+        # so rows saved afterwards survive an Excel read-back
+        self._exported_count = 0
 
         # Set file paths once per program run and ensure unique names
         script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -274,13 +315,27 @@ class RollingResistanceApp:
         self.label_Crr_val = tk.Label(self.root, text="-", width=output_width, anchor="w")
         self.label_Crr_val.grid(row=18, column=1)
 
+        # Output label per result key with its bound format method, so
+        # on_calculate can update all numeric labels in one loop
+        self._label_bindings = [
+            (self.label_speed_val, "Speed [m/s]", "{:.3f}".format),
+            (self.label_I_idle_val, "Mean idle current [A]", "{:.3f}".format),
+            (self.label_I_load_val, "Mean load current [A]", "{:.3f}".format),
+            (self.label_P0_val, "P_0 [W]", "{:.3f}".format),
+            (self.label_Pw_val, "P_load [W]", "{:.3f}".format),
+            (self.label_Prr_val, "P_rr [W]", "{:.3f}".format),
+            (self.label_mhang_val, "Weight on lever [kg]", "{:.3f}".format),
+            (self.label_meff_val, "Effective weight on tire [kg]", "{:.3f}".format),
+            (self.label_Crr_val, "C_rr", "{:.6f}".format),
+        ]
+
     def on_calculate(self):
         """Read inputs, run physics computation and update GUI labels."""
         try:
             idle_values = parse_float_list(self.entry_idle.get())
             load_values = parse_float_list(self.entry_load.get())
 
-            w_text = self.entry_weight.get().replace(",", ".").strip()
+            w_text = self.entry_weight.get().translate(_COMMA_TO_DOT).strip()
             if not w_text:
                 raise ValueError("No weight entered")
             m_hang = float(w_text)
@@ -288,17 +343,10 @@ class RollingResistanceApp:
             core_result = compute_result(idle_values, load_values, m_hang)
 
             tire_name = self.entry_tire.get().strip()
-            tire_pressure = self.entry_pressure.get().replace(",", ".").strip()
-
-            self.label_speed_val.config(text=f"{core_result['Speed [m/s]']:.3f}")
-            self.label_I_idle_val.config(text=f"{core_result['Mean idle current [A]']:.3f}")
-            self.label_I_load_val.config(text=f"{core_result['Mean load current [A]']:.3f}")
-            self.label_P0_val.config(text=f"{core_result['P_0 [W]']:.3f}")
-            self.label_Pw_val.config(text=f"{core_result['P_load [W]']:.3f}")
-            self.label_Prr_val.config(text=f"{core_result['P_rr [W]']:.3f}")
-            self.label_mhang_val.config(text=f"{core_result['Weight on lever [kg]']:.3f}")
-            self.label_meff_val.config(text=f"{core_result['Effective weight on tire [kg]']:.3f}")
-            self.label_Crr_val.config(text=f"{core_result['C_rr']:.6f}")
+            tire_pressure = self.entry_pressure.get().translate(_COMMA_TO_DOT).strip()
+
+            for widget, key, fmt in self._label_bindings:
+                widget.config(text=fmt(core_result[key]))
             self.label_tire_val.config(text=tire_name if tire_name else "-")
             self.label_pressure_val.config(text=tire_pressure if tire_pressure else "-")
 
@@ -314,126 +362,130 @@ class RollingResistanceApp:
         except ValueError as e:
             messagebox.showerror("Error", f"Input error: {e}")
 
-    def _append_last_result_to_excel_if_exists(self):
-        """Append the last result as a new row to the current Excel file if it exists."""
-        if self.last_result is None:
-            return
-
-        filename_xlsx = self.filename_xlsx
-
-        if not os.path.exists(filename_xlsx):
-            return
-
-        try:
-            wb = load_workbook(filename_xlsx)
-            if "Data" in wb.sheetnames:
-                ws = wb["Data"]
-            else:
-                ws = wb.active
-
-            # If the sheet is empty, write the header first
-            if ws.max_row == 1 and all(c.value is None for c in ws[1]):
-                for col, name in enumerate(FIELDNAMES, start=1):
-                    ws.cell(row=1, column=col, value=name)
-
-            new_row_idx = ws.max_row + 1
-            # Use the first data row as a style template if available
-            template_row_idx = 2 if ws.max_row >= 2 else 1
-
-            for col, key in enumerate(FIELDNAMES, start=1):
-                val = format_value(key, self.last_result.get(key, ""))
-                new_cell = ws.cell(row=new_row_idx, column=col, value=val)
-
-                template_cell = ws.cell(row=template_row_idx, column=col)
-                if template_cell.has_style:
-                    new_cell._style = template_cell._style
-
-            wb.save(filename_xlsx)
-            wb.close()
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not append to Excel:\n{e}")
-
     def on_save_to_list(self):
-        """Save the current result to the in memory list and to Excel if present."""
+        """Save the current result to the in memory list."""
         if self.last_result is None:
             messagebox.showerror("Error", "Please press Calculate before Save to List")
             return
         self.saved_rows.append(self.last_result.copy())
-        self._append_last_result_to_excel_if_exists()
         messagebox.showinfo("Saved", f"Data set number {len(self.saved_rows)} saved in list")
 
-    def on_go_to_excel(self):
-        """Create Excel if needed, sync CSV with Excel and open the Excel file."""
-        filename_csv = self.filename_csv
-        filename_xlsx = self.filename_xlsx
+    def _sync_rows_from_excel_if_edited(self):
+        """Read the Excel file back into saved_rows if the user edited it.
 
-        try:
-            # Create Excel file once from saved_rows if it does not exist yet
-            if not os.path.exists(filename_xlsx):
-                if not self.saved_rows:
-                    messagebox.showerror("Error", "No data in list to export\nUse Save to List first")
-                    return
-
-                workbook = xlsxwriter.Workbook(filename_xlsx)
-                worksheet = workbook.add_worksheet("Data")
-
-                header_format = workbook.add_format({
-                    "bold": True,
-                    "bg_color": "#D9D9D9",
-                    "align": "center",
-                    "border": 1,
-                })
-
-                cell_format = workbook.add_format({
-                    "align": "center",
-                    "border": 1,
-                })
-
-                for col, name in enumerate(FIELDNAMES):
-                    worksheet.write(0, col, name, header_format)
+        Returns False when the file was edited but could not be read, after
+        showing an error dialog.
+        """
+        if not self._xlsx_exists:
+            return True
 
-                for row_idx, row in enumerate(self.saved_rows, start=1):
-                    for col_idx, key in enumerate(FIELDNAMES):
-                        val = format_value(key, row.get(key, ""))
-                        worksheet.write(row_idx, col_idx, val, cell_format)
+        try:
+            mtime = os.path.getmtime(self.filename_xlsx)
+        except OSError:
+            # The user deleted the file; carry on with the in-memory list
+            # and let the next export recreate it
+            self._xlsx_exists = False
+            return True
+        if mtime <= self._last_write_mtime:
+            return True
 
-                worksheet.set_column(0, len(FIELDNAMES) - 1, 18)
-                workbook.close()
+        try:
+            from openpyxl import load_workbook
 
-            # Read the current Excel content and regenerate the CSV so CSV follows Excel
+            wb = load_workbook(self.filename_xlsx, data_only=True, read_only=True)
             try:
-                wb = load_workbook(filename_xlsx, data_only=True)
                 if "Data" in wb.sheetnames:
                     ws = wb["Data"]
                 else:
                     ws = wb.active
 
                 header = [cell.value for cell in ws[1]]
+                # Stringify the header once instead of per cell
+                header_str = tuple(str(h) for h in header if h is not None)
+                header_idx = tuple(i for i, h in enumerate(header) if h is not None)
                 rows = []
                 for row in ws.iter_rows(min_row=2, values_only=True):
                     if row is None:
                         continue
-                    if all(cell is None for cell in row):
+                    if not any(row):
                         continue
-                    row_dict = {}
-                    for i, col_name in enumerate(header):
-                        if col_name is None:
-                            continue
-                        val = row[i] if i < len(row) else ""
-                        row_dict[str(col_name)] = val
-                    rows.append(row_dict)
+                    n = len(row)
+                    rows.append(dict(zip(
+                        header_str,
+                        (row[i] if i < n else "" for i in header_idx),
+                    )))
+            finally:
                 wb.close()
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not read Excel data:\n{e}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not read Excel data:\n{e}")
+            return False
+
+        # Replace only the previously exported part of the list with the
+        # file content; rows saved with Save to List since the last export
+        # are kept
+        self.saved_rows = rows + self.saved_rows[self._exported_count:]
+        self._exported_count = len(rows)
+        self._last_write_mtime = mtime
+        return True
+
+    def on_go_to_excel(self):
+        """Rebuild the Excel file from the saved list, sync the CSV and open it."""
+        filename_csv = self.filename_csv
+        filename_xlsx = self.filename_xlsx
+
+        try:
+            # If the user changed the Excel file since our last write, pull
+            # those edits back into saved_rows before rebuilding
+            if not self._sync_rows_from_excel_if_edited():
                 return
 
-            # Write CSV from the Excel rows
+            # Rebuild the Excel file from saved_rows on every export
+            if not self.saved_rows:
+                messagebox.showerror("Error", "No data in list to export\nUse Save to List first")
+                return
+
+            # constant_memory streams each finished row to disk instead of
+            # buffering the whole sheet until close()
+            workbook = xlsxwriter.Workbook(
+                filename_xlsx,
+                {"constant_memory": True, "strings_to_numbers": False},
+            )
+            worksheet = workbook.add_worksheet("Data")
+            # Column widths must be set before any cell is written in this mode
+            worksheet.set_column(0, len(FIELDNAMES) - 1, 18)
+
+            header_format = workbook.add_format({
+                "bold": True,
+                "bg_color": "#D9D9D9",
+                "align": "center",
+                "border": 1,
+            })
+
+            cell_format = workbook.add_format({
+                "align": "center",
+                "border": 1,
+            })
+
+            # Emit each row to the Excel sheet and the CSV in one pass so the
+            # formatted values are built only once per row
             with open(filename_csv, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=FIELDNAMES, delimiter=";")
-                writer.writeheader()
-                for row in rows:
-                    out = {key: format_value(key, row.get(key, "")) for key in FIELDNAMES}
-                    writer.writerow(out)
+                writer = csv.writer(f, delimiter=";")
+
+                worksheet.write_row(0, 0, FIELDNAMES, header_format)
+                writer.writerow(FIELDNAMES)
+
+                for row_idx, row in enumerate(self.saved_rows, start=1):
+                    row_vals = [
+                        _COL_FORMATTERS[col](row.get(key, ""))
+                        for col, key in enumerate(FIELDNAMES)
+                    ]
+                    worksheet.write_row(row_idx, 0, row_vals, cell_format)
+                    writer.writerow(row_vals)
+
+            workbook.close()
+            self._last_write_mtime = os.path.getmtime(filename_xlsx)
+            self._xlsx_exists = True
+            self._exported_count = len(self.saved_rows)
 
             # Try to open the Excel file for the user
             try:
@@ -451,43 +503,17 @@ class RollingResistanceApp:
 
     def on_plot_pressure_vs_crr(self):
         """Read data from Excel or list and plot Crr versus tire pressure."""
-        filename_xlsx = self.filename_xlsx
-
-        rows = []
+        import matplotlib.pyplot as plt
 
-        # Prefer reading plot data from the Excel file so deletions there are respected
-        if os.path.exists(filename_xlsx):
-            try:
-                wb = load_workbook(filename_xlsx, data_only=True)
-                if "Data" in wb.sheetnames:
-                    ws = wb["Data"]
-                else:
-                    ws = wb.active
-
-                header = [cell.value for cell in ws[1]]
-                for row in ws.iter_rows(min_row=2, values_only=True):
-                    if row is None:
-                        continue
-                    if all(cell is None for cell in row):
-                        continue
-                    row_dict = {}
-                    for i, col_name in enumerate(header):
-                        if col_name is None:
-                            continue
-                        val = row[i] if i < len(row) else ""
-                        row_dict[str(col_name)] = val
-                    rows.append(row_dict)
-                wb.close()
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not read Excel data:\n{e}")
-                return
+        # Pull edits made in Excel back into saved_rows first so deletions
+        # there are respected, then plot from the list
+        if not self._sync_rows_from_excel_if_edited():
+            return
 
-        # Fallback to in memory saved_rows if Excel does not exist or has no data
-        if not rows:
-            if not self.saved_rows:
-                messagebox.showerror("Error", "No data in list to plot\nUse Save to List first")
-                return
-            rows = self.saved_rows
+        if not self.saved_rows:
+            messagebox.showerror("Error", "No data in list to plot\nUse Save to List first")
+            return
+        rows = self.saved_rows
 
         colors = [
             "steelblue",
@@ -506,7 +532,7 @@ class RollingResistanceApp:
             if name == "":
                 name = "Unknown tire"
 
-            pressure_text = str(row.get("Tire pressure [bar]", "")).replace(",", ".")
+            pressure_text = str(row.get("Tire pressure [bar]", "")).translate(_COMMA_TO_DOT)
             crr_value = row.get("C_rr", None)
 
             if pressure_text == "" or crr_value is None:
@@ -530,11 +556,12 @@ class RollingResistanceApp:
         fig = plt.figure(figsize=(7, 4.3))
         ax = fig.add_subplot(111)
 
-        # Plot curves for each tire type
+        # Plot curves for each tire type, sorted by pressure via NumPy
         for i, (tire_name, values) in enumerate(tire_groups.items()):
-            values_sorted = sorted(values, key=lambda x: x[0])
-            pressures = [v[0] for v in values_sorted]
-            crr_values = [v[1] for v in values_sorted]
+            arr = np.asarray(values, dtype=np.float64)
+            order = np.argsort(arr[:, 0])
+            pressures = arr[order, 0]
+            crr_values = arr[order, 1]
             color = colors[i % len(colors)]
 
             ax.plot(